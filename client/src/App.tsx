@@ -15,11 +15,12 @@ function App() {
   // })
 
     const [steamId, setSteamId] = useState(STEAM_ID)
-    const [displayWishlist, setDisplayWishlist] = useState(false)
+    // Only the id submitted with Enter is searched, typing doesn't trigger a new search
+    const [submittedId, setSubmittedId] = useState('')
 
     const handleEnterKey = (e: React.KeyboardEvent<HTMLInputElement>) => {
         if (e.key === 'Enter' && steamId.trim()) {
-            setDisplayWishlist(true)
+            setSubmittedId(steamId.trim())
         }
     }
   
@@ -32,9 +33,9 @@ function App() {
                 onChange={e => setSteamId(e.target.value)}
                 onKeyDown={handleEnterKey}
                 className="ml-auto block w-1/4 p-2 text-right border-white border"/>
-            {displayWishlist && (
+            {submittedId && (
                 <Wishlist
-                    steamId={steamId}
+                    steamId={submittedId}
                 />
             )}
         </div>
@@ -1,12 +1,24 @@
-import React, { useMemo } from 'react'
+import React, { useMemo, useState } from 'react'
 import { useQueries, useQuery } from "@tanstack/react-query"
+import type { UseQueryResult } from "@tanstack/react-query"
 
 import { fetchDealsGG } from "../api"
 import type { DealsGGItem } from '../types/steam'
 import GameCard from './GameCard'
 
+// Collapses the batch queries into one result, only re-run when a query changes
+const combineDeals = (queries: UseQueryResult<DealsGGItem[]>[]) => ({
+    isLoading: queries.some(q => q.isLoading),
+    loadedCount: queries.filter(q => q.data).length,
+    errors: queries.filter(q => q.error).map(q => q.error),
+    allData: queries.flatMap(q => q.data ?? []),
+})
+
 const DealsGG = ({appids}: {appids: number[]}) => {
     const BATCH_SIZE = 50;
+    // Number of game cards rendered at a time
+    const PAGE_SIZE = 30;
+    const [visibleCount, setVisibleCount] = useState(PAGE_SIZE)
 
     const chunks = useMemo(() => {
         const results = [];
@@ -16,22 +28,16 @@ const DealsGG = ({appids}: {appids: number[]}) => {
         return results;
     }, [appids]);
 
-    const queries = useQueries({
+    const { isLoading, loadedCount, errors, allData } = useQueries({
         queries: chunks.map((chunk, index) => ({
             queryKey: ['appids', chunk],
             queryFn: () => fetchDealsGG(chunk),
             staleTime: 5 * 60 * 1000, // Cache for 5 minutes
-        }))
+        })),
+        combine: combineDeals
     })
     
-    const isLoading = queries.some(q => q.isLoading)
-    const errors = queries.filter(q => q.error).map(q => q.error)
-    const allData = queries
-        .filter(q => q.data)
-        .flatMap(q => q.data!)
-    
     if (isLoading) {
-        const loadedCount = queries.filter(q => q.data).length
         return <div>Loading deals... {loadedCount}/{chunks.length} batches loaded</div>
     }
     
@@ -39,8 +45,21 @@ const DealsGG = ({appids}: {appids: number[]}) => {
         return <div>Error loading some deals: {errors[0]?.message}</div>
     }
 
+    if (allData.length === 0) {
+        return <div>No deals found.</div>
+    }
+
     return (
-        <div>{allData?.map(deal => <GameCard key={deal.appid} game={deal}/>)}</div>
+        <div>
+            {allData.slice(0, visibleCount).map(deal => <GameCard key={deal.appid} game={deal}/>)}
+            {visibleCount < allData.length && (
+                <button
+                    onClick={() => setVisibleCount(count => count + PAGE_SIZE)}
+                    className="block mx-auto mt-4 bg-blue-600 text-white font-bold py-2 px-4 rounded hover:bg-blue-700">
+                    Load more ({allData.length - visibleCount} remaining)
+                </button>
+            )}
+        </div>
     )
 }
 
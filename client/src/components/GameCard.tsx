@@ -2,8 +2,17 @@ import React from 'react'
 
 import type { DealsGGItem } from '../types/steam'
 
+// Shown when a game has no image, every card shares the same element
+const IMAGE_PLACEHOLDER = (
+  <div className="w-full h-full flex items-center justify-center">
+      <span className="text-lg font-bold text-gray-400 uppercase tracking-wider">
+      Image
+      </span>
+  </div>
+)
 
 const GameCard = ({game}: {game: DealsGGItem}) => {
+    const { name, url, image_url, prices } = game
     return (
       <div className="w-full max-w-5xl mx-auto">
         <div className="border-4 border-black rounded-xl overflow-hidden shadow-2xl">
@@ -11,34 +20,30 @@ const GameCard = ({game}: {game: DealsGGItem}) => {
             {/* LEFT: Image */}
             <div className="px-6">
               <div className="h-40 border-2 border-black bg-gray-50 overflow-hidden">
-                  {game?.image_url ? (
+                  {image_url ? (
                   <img
-                      src={game.image_url}
-                      alt={game.name}
+                      src={image_url}
+                      alt={name}
+                      loading="lazy"
+                      decoding="async"
                       className="w-full h-full object-cover"
                   />
-                  ) : (
-                  <div className="w-full h-full flex items-center justify-center">
-                      <span className="text-lg font-bold text-gray-400 uppercase tracking-wider">
-                      Image
-                      </span>
-                  </div>
-                  )}
+                  ) : IMAGE_PLACEHOLDER}
               </div>
             </div>
 
             {/* MIDDLE: Game Name (takes remaining space) */}
             <div className="flex-1 px-8 py-10">
               <h2 className="text-3xl font-black text-center uppercase tracking-wider">
-                {game?.name}
+                {name}
               </h2>
             </div>
 
             {/* RIGHT: Price Buttons (vertical stack) */}
             <div className="p-6 flex flex-col gap-1 w-1/4">
-              {displayPriceButton("Retail", game?.prices?.retail_price)}
-              {displayPriceButton("Keyshop", game?.prices?.keyshop_price)}
-              <a href={game?.url} target="_blank"  rel="noopener noreferrer" className="mt-2 text-center bg-blue-600 text-white font-bold py-2 px-4 rounded hover:bg-blue-700">View Deal</a>
+              {displayPriceButton("Retail", prices?.retail_price)}
+              {displayPriceButton("Keyshop", prices?.keyshop_price)}
+              <a href={url} target="_blank"  rel="noopener noreferrer" className="mt-2 text-center bg-blue-600 text-white font-bold py-2 px-4 rounded hover:bg-blue-700">View Deal</a>
             </div>
           </div>
         </div>
@@ -61,4 +66,5 @@ function covertToUSD(cents: number): string {
   return '$' + (cents / 100).toFixed(2)
 }
 
-export default GameCard;
+// Deals don't change once loaded, so a card only re-renders when its game does
+export default React.memo(GameCard);
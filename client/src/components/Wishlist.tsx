@@ -11,8 +11,9 @@ type WishlistProps = {
 
 const Wishlist = ({steamId}: WishlistProps) => {
     const {data, isLoading, error} = useQuery<WishlistItem[]>({
-            queryKey: ['steamUser', steamId],
-            queryFn: () => fetchUserWishlist(steamId)
+            queryKey: ['wishlist', steamId],
+            queryFn: () => fetchUserWishlist(steamId),
+            staleTime: 5 * 60 * 1000, // Cache for 5 minutes
     })
 
     if (isLoading) return <div>Loading...</div>
@@ -21,8 +22,11 @@ const Wishlist = ({steamId}: WishlistProps) => {
     // Use appid to get games from dealsgg
 
     const game_appids = data?.map(game => game.appid) || []
+    if (game_appids.length === 0) return <div>No games on this wishlist.</div>
+
+    // Keyed by user so the shown page count starts over for each wishlist
     return (
-        <DealsGG appids={game_appids}/>
+        <DealsGG key={steamId} appids={game_appids}/>
     )
 }
 
@@ -2,7 +2,7 @@ import uvicorn
 import os
 import logging
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Path
 from pydantic import TypeAdapter, ValidationError
 from contextlib import asynccontextmanager
 
@@ -17,6 +17,7 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 STEAM_API_KEY = os.getenv('STEAM_API_KEY')
 DEALS_API_KEY = os.getenv('DEALS_API_KEY')
+STEAM_ID_PATTERN = r'^[0-9]+$'
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -31,7 +32,7 @@ async def lifespan(app: FastAPI):
 app = FastAPI(lifespan=lifespan)  
 
 @app.get('/api/steam/user/{steam_id}')
-async def get_steam_user(steam_id: str):
+async def get_steam_user(steam_id: str = Path(pattern=STEAM_ID_PATTERN)):
     return await fetch_and_validate(
         fetch_func=lambda: steam.get_user_account(steam_id),
         validator=SteamPlayer,
@@ -50,7 +51,7 @@ async def get_steam_game(appid: str):
 
 wishlist_adapter = TypeAdapter(list[Wishlist])    
 @app.get('/api/steam/user/wishlist/{steam_id}')
-async def get_user_wishlist(steam_id: str):
+async def get_user_wishlist(steam_id: str = Path(pattern=STEAM_ID_PATTERN)):
     return await fetch_and_validate(
         fetch_func=lambda: steam.get_wishlist(steam_id),
         validator=wishlist_adapter,
@@ -82,6 +83,9 @@ async def fetch_and_validate(fetch_func, validator, not_found_message: str, vali
     try:
         data = await fetch_func()
         if not data:
+            # Nothing in a list is still a valid answer, only single items can be missing
+            if isinstance(validator, TypeAdapter):
+                return []
             raise HTTPException(status_code=404, detail=not_found_message)
 
         if hasattr(validator, 'validate_python'):
@@ -89,12 +93,15 @@ async def fetch_and_validate(fetch_func, validator, not_found_message: str, vali
         else:
             return validator(**data)
     
+    except HTTPException:
+        raise
+    
     except ValidationError as e:
-        logger.error(f'Validation Error: {e}')
+        logger.error('Validation Error: %s', e)
         raise HTTPException(status_code=502, detail=validation_error_message)
     
     except Exception as error:
-        logger.error(f'Steam API Error: {error}')
+        logger.error('Steam API Error: %s', error)
         raise HTTPException(status_code=500, detail='Error fetching data from Steam API')
 
 if __name__ == '__main__':
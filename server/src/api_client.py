@@ -0,0 +1,55 @@
+# Shared HTTP handling for the external API clients (Steam, GG Deals)
+import httpx
+import logging
+import asyncio
+
+logger = logging.getLogger(__name__)
+
+class APIClient():
+    """
+        Base class for clients of external web APIs.
+        Owns the HTTP session and the request/retry handling every client uses.
+    """
+    # Seconds to wait when rate limited and no Retry-After is given, and the most ever waited
+    RETRY_WAIT = 5
+    MAX_RETRY_WAIT = 60
+    # httpx's default pool sizes, but idle connections outlive the waits between rate limited calls
+    POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30)
+
+    def __init__(self):
+        self.session = httpx.AsyncClient(limits=self.POOL_LIMITS)
+
+    async def _make_request(self, url, params={}) -> dict[str, any]:
+        """
+            Retrieves data from url if it exists.
+            When rate limited, waits as long as the server asks and tries once more.
+
+            Returns: response from given url.
+            Raises:
+                httpx.HTTPError if request fails
+        """
+        try:
+            response = await self.session.get(url, params=params)
+            if response.status_code == 429:
+                await asyncio.sleep(self._get_retry_wait(response))
+                response = await self.session.get(url, params=params)
+
+            response.raise_for_status()
+            data = response.json()
+
+            return data
+        except httpx.HTTPError as e:
+            logger.error("Failed to retrieve data from %s!", url)
+            raise e
+
+    def _get_retry_wait(self, response: httpx.Response) -> float:
+        """
+            Return: seconds to wait before retrying a rate limited request.
+        """
+        retry_after = response.headers.get('retry-after', '')
+        wait_time = min(float(retry_after) if retry_after.isdigit() else self.RETRY_WAIT, self.MAX_RETRY_WAIT)
+        logger.warning("Rate limited by %s, retrying in %s seconds.", response.url.host, wait_time)
+        return wait_time
+
+    async def aclose(self):
+        await self.session.aclose()
@@ -3,53 +3,94 @@
 # References:
 # - https://gg.deals/api/prices/
 import logging
-import requests
-import httpx
+import asyncio
+
+from src.api_client import APIClient
+from src.ttl_cache import TTLCache
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logging.getLogger("httpx").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
-class DealsGGAPI():
+class DealsGGAPI(APIClient):
     """
         A client for interacting with the GG Deals API.
         Provides methods to fetch game product details.
     """
     GG_DEALS_BASE_URL = 'https://api.gg.deals/v1/prices/by-steam-app-id/'
+    GAME_IMAGE_URL = 'https://cdn.cloudflare.steamstatic.com/steam/apps/{appid}/library_600x900.jpg'
+    # Price name sent back paired with the GG Deals price field it comes from
+    PRICE_FIELDS = (
+        ("retail_price", "currentRetail"),
+        ("retail_price_low", "historicalRetail"),
+        ("keyshop_price", "currentKeyshops"),
+        ("keyshop_price_low", "historicalKeyshops"),
+    )
+    # Seconds a game's prices are reused before asking GG Deals again
+    CACHE_TTL = 10 * 60
+    CACHE_SIZE = 10000
+    # Most appids GG Deals accepts in a single request
+    MAX_IDS_PER_REQUEST = 100
+    # Most price requests sent to GG Deals at the same time
+    MAX_CONCURRENT_REQUESTS = 8
     
     def __init__(self, api_key:str):
+        super().__init__()
         self.api_key = api_key
-        self.session = httpx.AsyncClient()
+        # Popular games show up on many wishlists, keep their prices around between requests
+        self.cache = TTLCache(self.CACHE_TTL, self.CACHE_SIZE)
+        self.request_limit = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
         
     async def find_products_by_appid(self, appids, max_price: float = 5.00) -> list[dict[str, any]] | None:      
-        params = {
-            'ids': ','.join(map(str, appids)),
-            'key': self.api_key
-        }
+        games = {}
+        missing_appids = []
+        for appid in map(str, appids):
+            game = self.cache.get(appid)
+            if game is None:
+                missing_appids.append(appid)
+            else:
+                games[appid] = game
+        
+        # Appids beyond what GG Deals takes in one request are split up and requested together
+        fetched_games = await asyncio.gather(*(
+            self._request_prices(missing_appids[start:start + self.MAX_IDS_PER_REQUEST])
+            for start in range(0, len(missing_appids), self.MAX_IDS_PER_REQUEST)
+        ))
+        for fetched in fetched_games:
+            games.update(fetched)
         
-        response = await self._make_request(self.GG_DEALS_BASE_URL, params)
-        game_deals = self._process_json(response, max_price)
+        # Deals are sent back in the same order as the appids asked for
+        ordered_games = {appid: games[appid] for appid in map(str, appids) if appid in games}
+        game_deals = self._process_json(ordered_games, max_price)
         return game_deals
     
-    # TODO: this can be in its own file
-    async def _make_request(self, url, params={}) -> dict[str, any]:
-        try:
-            response = await self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+    async def _request_prices(self, appids: list[str]) -> dict[str, any]:
+        """ 
+            Retrieves GG Deals prices for the appids, waiting while too many requests are already running.
+            Games are cached as soon as they arrive, so they aren't lost if another request fails.
             
-            return data
-        except httpx.HTTPError as e:
-            logger.error(f"Failed to retrieve data from {url}!")
-            raise e
+            Return: dict of appid to GG Deals game data.
+        """
+        params = {
+            'ids': ','.join(appids),
+            'key': self.api_key
+        }
+        
+        async with self.request_limit:
+            response = await self._make_request(self.GG_DEALS_BASE_URL, params)
+        
+        games = {}
+        if response['success'] and response['data']:
+            for appid, game in response['data'].items():
+                if game:
+                    self.cache.set(appid, game)
+                    games[appid] = game
+                    
+        return games
     
-    def _process_json(self, response, max_price) -> list[dict[str, any]] | None:
+    def _process_json(self, game_deals: dict[str, any], max_price) -> list[dict[str, any]] | None:
         """ 
-            What to do with the game data returned by steam.
+            What to do with the game data returned by GG Deals.
         """
-        if response['success'] and response['data']:
-            game_deals = response['data']
-            
+        if game_deals:
             return [
                 game_data
                 for appid, game in game_deals.items()
@@ -63,13 +104,15 @@ class DealsGGAPI():
         if not prices:
             return None
         
+        game_prices = {name: self._safe_float(prices.get(field)) for name, field in self.PRICE_FIELDS}
+        
         # Remove any game that is free
-        retail_price = self._safe_float(prices.get("currentRetail"))
+        retail_price = game_prices["retail_price"]
         if retail_price == 0.0:
             return None
         
         # Only allow games under a certain price point
-        keyshop_price = self._safe_float(prices.get("currentKeyshops"))
+        keyshop_price = game_prices["keyshop_price"]
         keyshop_above_max = (keyshop_price == 0.0 or keyshop_price > max_price)
         if retail_price > max_price and keyshop_above_max:
             return None
@@ -78,13 +121,8 @@ class DealsGGAPI():
             "appid": int(appid),
             "name": game.get("title", "NA"),
             "url": game.get("url", "NA"),
-            "image_url": f"https://cdn.cloudflare.steamstatic.com/steam/apps/{appid}/library_600x900.jpg",
-            "prices": {
-                "retail_price": retail_price,
-                "retail_price_low": self._safe_float(prices.get("historicalRetail")),
-                "keyshop_price": keyshop_price,
-                "keyshop_price_low": self._safe_float(prices.get("historicalKeyshops")),
-            },
+            "image_url": self.GAME_IMAGE_URL.format(appid=appid),
+            "prices": game_prices,
             "currency": prices.get("currency", "USD")
         }
         
@@ -92,7 +130,4 @@ class DealsGGAPI():
         return float(value) if value else 0.00
     
     def get_base_url(self):
-        return self.GG_DEALS_BASE_URL
-    
-    async def aclose(self):
-        await self.session.aclose()
\ No newline at end of file
+        return self.GG_DEALS_BASE_URL
\ No newline at end of file
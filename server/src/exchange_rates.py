@@ -5,8 +5,6 @@ import logging
 
 from helper import load_from_json
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logging.getLogger("httpx").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 # check time and if longer than a day, get new exchange rate and set new time
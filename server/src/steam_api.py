@@ -17,13 +17,17 @@ from datetime import datetime
 import time
 from bs4 import BeautifulSoup
 
+from src.api_client import APIClient
+from src.ttl_cache import TTLCache
 from src.types.steam import correct_user_account_response, correct_game_data_response, correct_user_wishlist_response
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logging.getLogger("httpx").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
-class Steam():
+# Patterns used to clean every game description
+HTML_TAG_PATTERN = re.compile(r'<.*?>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+class Steam(APIClient):
     """ 
      Steam API client class to access data.
      - User wishlist and library
@@ -37,6 +41,11 @@ class Steam():
     STEAM_USER_URL = 'https://api.steampowered.com/ISteamUser/GetPlayerSummaries/v0002/'
     STEAM_TAG_URL = "https://partner.steamgames.com/doc/store/tags"
     STEAM_BASE_URL = "https://store.steampowered.com/app/"
+    # Number of screenshots kept for each game
+    MAX_SCREENSHOTS = 4
+    # Seconds a game's data is reused before asking Steam again
+    CACHE_TTL = 30 * 60
+    CACHE_SIZE = 5000
     
     def __init__(self, steam_api_key: str):
         """ 
@@ -48,8 +57,10 @@ class Steam():
         if not steam_api_key:
             raise ValueError("API key cannot be empty or None")
         
+        super().__init__()
         self.steam_api_key = steam_api_key
-        self.session = httpx.AsyncClient()
+        # Game data barely changes between requests, the same games show up on many wishlists
+        self.cache = TTLCache(self.CACHE_TTL, self.CACHE_SIZE)
     
     async def get_user_account(self, user_id: str) -> dict[str, any]:
         """
@@ -73,28 +84,10 @@ class Steam():
         
         processed_data = self._process_user_data(player[0])
         if not processed_data:
-            logger.warning(f"Steam UserId: {user_id} doesn't exist!")
+            logger.warning("Steam UserId: %s doesn't exist!", user_id)
         
         return processed_data
     
-    async def _make_request(self, url, params={}) -> dict[str, any]:
-        """
-            Retrieves data from url if it exists.
-                
-            Returns: response from given url.
-            Raises: 
-                httpx.HTTPError if request fails
-        """
-        try:
-            response = await self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            return data
-        except httpx.HTTPError as e:
-            logger.error(f"Failed to retrieve data from {url}!")
-            raise e
-        
     # TODO: This can be in its own file, nothing to do with steam_api   
     def _check_response(self, response: dict[str, any], correct_structure: dict[str, any]) -> dict[str, any]:
         """ 
@@ -137,23 +130,31 @@ class Steam():
         """ 
         Note: Steam only allows 200 calls per 5 minutes
         - (5*60) / 200 = 1.5
+        Games retrieved recently are taken from the cache instead.
         """
         wait_time = 1.6
         try:
-            games_downloaded = 0
-            games_to_download = len(appids)
-            processed_games = []
-            
+            processed_games = {}
+            appids_to_download = []
             for appid in appids:
+                cached_game = self.cache.get(appid)
+                if cached_game is None:
+                    appids_to_download.append(appid)
+                else:
+                    processed_games[appid] = cached_game
+            
+            games_downloaded = 0
+            games_to_download = len(appids_to_download)
+            for appid in appids_to_download:
                 processed_game = await self.get_game_data(appid)
                 if processed_game:
-                    processed_games.append(processed_game)
+                    processed_games[appid] = processed_game
                 await asyncio.sleep(wait_time)
                 games_downloaded += 1
-                logger.info(f"Games: {games_downloaded}/{games_to_download} games retrieved from Server!") 
+                logger.info("Games: %d/%d games retrieved from Server!", games_downloaded, games_to_download) 
             
-            logger.info(f"Games: {len(processed_games)} games retrieved from Server!") 
-            return processed_games
+            logger.info("Games: %d games retrieved, %d from cache!", len(processed_games), len(appids) - games_to_download) 
+            return [processed_games[appid] for appid in appids if appid in processed_games]
         except httpx.HTTPError as e:
             raise httpx.HTTPError(f"Games Retrieval Error: {e}")
     
@@ -163,19 +164,28 @@ class Steam():
             Retrieves game data, in english, from steam server.
             Return: dict containing all important game data
         """
+        cached_game = self.cache.get(appid)
+        if cached_game is not None:
+            return cached_game
+        
         params = {
             'appids': appid,
             'l': 'english'
         }
         
-        response = await self._make_request(self.STEAM_GAME_URL, params)
+        # Game data and store page tags don't depend on each other, request both at once
+        response, tags = await asyncio.gather(
+            self._make_request(self.STEAM_GAME_URL, params),
+            self.get_steam_tags(appid)
+        )
         game = self._check_response(response, correct_game_data_response(str(appid)))
         
         processed_data = self._process_game_data(appid, game)
         if not processed_data:
-            logger.warning(f"GameId: {appid} has no information!")
+            logger.warning("GameId: %s has no information!", appid)
             
-        processed_data["tags"] = await self.get_steam_tags(appid)
+        processed_data["tags"] = tags
+        self.cache.set(appid, processed_data)
         return processed_data     
         
     def _process_game_data(self, appid: int, game: dict[str,any]) -> dict[str,any]:
@@ -205,17 +215,12 @@ class Steam():
             "developers": game.get("developers", []),
             "publishers": game.get("publishers", []),
             "categories": game.get("categories", []),
-            "genres": game.get("genres", [])
+            "genres": game.get("genres", []),
+            "price_overview": self._get_game_price(game),
+            "metacritic": self._get_game_metacritic(game),
+            "screenshots": [image['path_full'] for image in game.get('screenshots', [])[:self.MAX_SCREENSHOTS]]
         }
         
-        process_data["price_overview"] = self._get_game_price(game)  
-        process_data["metacritic"] = self._get_game_metacritic(game)
-        
-        screenshots = game.get('screenshots', [])
-        if screenshots and len(screenshots) > 4:
-            screenshots = screenshots[0:4]
-        process_data["screenshots"] = [image['path_full'] for image in screenshots]
-        
         return process_data
     
     def _get_game_price(self, data: dict[str, any]) -> dict[str,any]:
@@ -258,7 +263,6 @@ class Steam():
         return metacritic
     
     async def get_steam_tags(self, appid) -> list:
-        tags = []
         try:
             wait_time = 1.6
             res = await self.session.get(f"{self.STEAM_BASE_URL}{appid}")
@@ -268,25 +272,36 @@ class Steam():
                 
             res.raise_for_status()
             
-            soup = BeautifulSoup(res.text, 'html.parser')
-            
-            tags_container = soup.find('div', class_='glance_tags popular_tags')
-            if not tags_container:
+            # Parsing the store page is CPU bound, keep it off the event loop
+            tags = await asyncio.to_thread(self._parse_steam_tags, res.text)
+            if tags is None:
                 return []
             
-            tags_links = tags_container.find_all('a', class_='app_tag')
-            
-            for link in tags_links:
-                tag_text = link.get_text().strip()
-                if tag_text:
-                    tags.append(tag_text)
             await asyncio.sleep(wait_time)
                     
         except httpx.HTTPError as e:
-            logger.error(f"Games Retrieval Error: {e}")
+            logger.error("Games Retrieval Error: %s", e)
             raise httpx.RequestError(f"Failed to retrieve tags from {self.STEAM_BASE_URL}{appid}!")
                 
         return tags
+    
+    def _parse_steam_tags(self, html: str) -> list | None:
+        """ 
+            Return: tags listed on a game's store page, None if the page has no tag section.
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        tags_container = soup.find('div', class_='glance_tags popular_tags')
+        if not tags_container:
+            return None
+        
+        tags = []
+        for link in tags_container.find_all('a', class_='app_tag'):
+            tag_text = link.get_text().strip()
+            if tag_text:
+                tags.append(tag_text)
+                
+        return tags
             
     async def _handle_age_gate(self, res: httpx.Response) -> httpx.Response:
         age_data = {
@@ -327,14 +342,11 @@ class Steam():
         
         response = await self._make_request(self.STEAM_WISHLIST_URL, params)
         wishlist = self._check_response(response, correct_user_wishlist_response())
-        if len(wishlist) == 0:
-            raise ValueError(f'SteamId: {steam_id}, no wishlist found.')
-        
         processed_data = self._process_wishlist_data(wishlist, steam_id)
         if not processed_data:
-            logger.warning(f"SteamId: {steam_id} has no wishlist items!")
+            logger.warning("SteamId: %s has no wishlist items!", steam_id)
         else:
-            logger.info(f"SteamId {steam_id}, {len(processed_data)} wishlist items retrieved from Server!")
+            logger.info("SteamId %s, %d wishlist items retrieved from Server!", steam_id, len(processed_data))
             
         return processed_data
     
@@ -346,16 +358,15 @@ class Steam():
             - appid: id of game
             - priority: How much user wants that game. 1 = Most Wanted
         """
-        process_data = []
-        for item in wishlist:
-            if "appid" in item:
-                process_data.append({
-                    "steamid": user_id,
-                    "appid": item["appid"],
-                    "priority": item.get("priority", 9999)
-                })
-            
-        return process_data
+        return [
+            {
+                "steamid": user_id,
+                "appid": item["appid"],
+                "priority": item.get("priority", 9999)
+            }
+            for item in wishlist
+            if "appid" in item
+        ]
     
     
     
@@ -481,15 +492,11 @@ class Steam():
     
     def _strip_for_text(self, text):
         # Remove HTML tags
-        clean_text = re.sub(r'<.*?>', '', text)
-        text = text.replace('"', "'")
+        clean_text = HTML_TAG_PATTERN.sub('', text)
         # Replace HTML entities
         clean_text = clean_text.replace('&nbsp;', ' ')
         # Remove extra spaces and newlines
-        clean_text = re.sub(r'\s+', ' ', clean_text)
+        clean_text = WHITESPACE_PATTERN.sub(' ', clean_text)
         
         clean_text = clean_text.strip()
-        return clean_text
-    
-    async def aclose(self):
-        await self.session.aclose()
\ No newline at end of file
+        return clean_text
\ No newline at end of file
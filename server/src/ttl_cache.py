@@ -0,0 +1,43 @@
+import time
+from collections import OrderedDict
+
+class TTLCache():
+    """
+        A small in-memory cache whose entries expire after a set number of seconds.
+        Once full, the least recently used entry is dropped.
+    """
+    def __init__(self, ttl: float, max_size: int):
+        """
+            Args:
+                ttl: seconds an entry stays valid
+                max_size: most entries kept at once
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+
+    def get(self, key, default=None):
+        """
+            Return: stored value, default if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)